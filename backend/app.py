@@ -4,20 +4,35 @@ functions for local and containerised development.
 This app allows you to run the backend entirely within a Docker
 container without relying on `sam local start-api`.  Each route
 constructs a minimal event dict (similar to API Gateway v2) and
-delegates to the corresponding Lambda handler.  The response body
-returned by the Lambda is parsed and returned as JSON with the
-appropriate HTTP status code.
+delegates to the corresponding Lambda handler.  The JSON body
+returned by the Lambda is passed through unchanged with the
+appropriate HTTP status code and headers.
 
-To run locally:
+To run locally with Flask's single-threaded development server:
 
     python app.py
 
-This will start the server on port 3001 by default.
+This will start the server on port 3001 by default.  The container
+image instead serves the app with gunicorn and gevent workers (see
+``gunicorn.conf.py``) so that requests blocked on a downstream AI
+provider do not hold up everyone else:
+
+    gunicorn -c gunicorn.conf.py app:app
 """
 from __future__ import annotations
+
+# Make blocking socket calls cooperative before boto3/openai are imported
+# by the Lambda handlers below.  gevent is only installed for the gunicorn
+# deployment; the development server runs fine without it.
+try:
+    from gevent import monkey
+
+    monkey.patch_all()
+except ImportError:
+    pass
+
 import os
-import json
-from flask import Flask, request, jsonify
+from flask import Flask, request
 
 # Import Lambda handlers
 """Flask application to route HTTP requests to our Lambda functions.
@@ -45,6 +60,11 @@ def _resolve_handler(module_path: str, fallback_path: str, attr: str):
     ``backend.lambdas``.  This helper tries both and returns the
     requested attribute.
 
+    This runs once per process at import time.  Under gunicorn the app
+    is preloaded (``preload_app`` in ``gunicorn.conf.py``) so the
+    handlers, and the SDKs they pull in, are imported once in the
+    master and shared copy-on-write by the forked workers.
+
     Args:
         module_path: Primary module path to import (e.g. 'backend.lambdas.getLessons.lambda_function').
         fallback_path: Secondary module path to import if the first fails (e.g. 'lambdas.getLessons.lambda_function').
@@ -56,7 +76,11 @@ def _resolve_handler(module_path: str, fallback_path: str, attr: str):
     """
     try:
         module = import_module(module_path)
-    except ImportError:
+    except ModuleNotFoundError as e:
+        # Only fall back when the primary path itself is missing; a missing
+        # dependency inside the handler should surface as-is.
+        if e.name and not (module_path + ".").startswith(e.name + "."):
+            raise
         module = import_module(fallback_path)
     return getattr(module, attr)
 
@@ -101,65 +125,75 @@ app = Flask(__name__)
 # a different port/domain can call the backend without browser errors.
 # In production you should restrict the allowed origins via the
 # ``CORS_ORIGINS`` environment variable.  Here we allow all origins by
-# default for local development.
-CORS(app, resources={r"/*": {"origins": os.environ.get("CORS_ORIGINS", "*")}})
+# default for local development.  Browsers may cache preflight responses
+# for ``max_age`` seconds, which saves an OPTIONS round trip before most
+# POSTs.  flask-cors adds ``Vary: Origin`` itself when the origins are
+# restricted.
+CORS(
+    app,
+    resources={r"/*": {"origins": os.environ.get("CORS_ORIGINS", "*"), "max_age": 86400}},
+    send_wildcard=True,
+)
+
+
+_DEFAULT_HEADERS = {"Content-Type": "application/json"}
 
 
 def call_lambda(handler, event):
-    """Call a Lambda handler and unpack the response into status, headers, body."""
+    """Call a Lambda handler and convert its response into a Flask response.
+
+    The handlers already serialise their body to JSON, so it is returned
+    as-is rather than being decoded and re-encoded with ``jsonify``.
+    Handler headers (including any ``Cache-Control``) pass through.
+    """
     result = handler(event, None)  # context is unused in our functions
     status = result.get("statusCode", 200)
+    headers = result.get("headers") or _DEFAULT_HEADERS
     body = result.get("body", "{}")
-    try:
-        json_body = json.loads(body)
-    except json.JSONDecodeError:
-        json_body = {"message": body}
-    return status, json_body
+    return body, status, headers
 
 
 @app.route("/lessons", methods=["GET"])
 def lessons_route():
     event = {"queryStringParameters": request.args.to_dict() or None}
-    status, body = call_lambda(get_lessons, event)
-    return jsonify(body), status
+    return call_lambda(get_lessons, event)
 
 
+# POST routes hand the raw request bytes to the handlers: API Gateway
+# delivers ``str`` bodies, but the JSON decoders in ``lambdas/shared/_common.py``
+# accept either, so decoding to ``str`` here would only cost a copy.
 @app.route("/ai", methods=["POST"])
 def ai_route():
-    event = {"body": request.data.decode("utf-8")}
-    status, body = call_lambda(ai_tutor, event)
-    return jsonify(body), status
+    event = {"body": request.get_data(cache=False)}
+    return call_lambda(ai_tutor, event)
 
 
 @app.route("/answer", methods=["POST"])
 def answer_route():
-    event = {"body": request.data.decode("utf-8")}
-    status, body = call_lambda(submit_answer, event)
-    return jsonify(body), status
+    event = {"body": request.get_data(cache=False)}
+    return call_lambda(submit_answer, event)
 
 
 @app.route("/report", methods=["POST"])
 def report_route():
-    event = {"body": request.data.decode("utf-8")}
-    status, body = call_lambda(generate_report, event)
-    return jsonify(body), status
+    event = {"body": request.get_data(cache=False)}
+    return call_lambda(generate_report, event)
 
 
 @app.route("/calendar", methods=["GET"])
 def calendar_route():
     event = {}
-    status, body = call_lambda(get_calendar, event)
-    return jsonify(body), status
+    return call_lambda(get_calendar, event)
 
 
 @app.route("/learning-style", methods=["GET"])
 def learning_style_route():
     # In a real implementation you might pass a studentId via query parameters
     event = {}
-    status, body = call_lambda(get_learning_style, event)
-    return jsonify(body), status
+    return call_lambda(get_learning_style, event)
 
 
 if __name__ == "__main__":
+    # Development server only; production traffic goes through gunicorn.
     port = int(os.environ.get("PORT", 3001))
     app.run(host="0.0.0.0", port=port)
\ No newline at end of file
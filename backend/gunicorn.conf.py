@@ -0,0 +1,20 @@
+"""gunicorn configuration for the backend container.
+
+Every route in ``app.py`` spends most of its time waiting on I/O (the
+AI providers in particular), so we run gevent workers: each worker
+process can hold many requests in flight at once instead of one.
+Settings can be overridden via the environment variables below.
+"""
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 3001)}"
+worker_class = "gevent"
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_connections = int(os.environ.get("WORKER_CONNECTIONS", 1000))
+
+# Import app.py (and with it every Lambda handler, boto3 and openai) once
+# in the master before forking, instead of once per worker.  The SDK
+# clients created at import do not open connections until first use, so
+# no sockets are shared between workers.
+preload_app = True
@@ -11,30 +11,40 @@ Input event example:
   "body": "{\"studentId\":\"abc123\", \"startDate\":\"2025-08-01\", \"endDate\":\"2025-08-07\"}"
 }
 """
-import json
 import logging
+from dataclasses import dataclass
+from typing import Optional
+
+try:
+    from ..shared._common import SchemaError, decode, err, ok
+except ImportError:
+    # Deployed on Lambda the handler is a top-level module and the
+    # helpers come from the shared layer.
+    from _common import SchemaError, decode, err, ok
 
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+
+
+@dataclass
+class GenerateReportRequest:
+    """Body of a POST /report request."""
+
+    studentId: Optional[str] = None
+    startDate: Optional[str] = None
+    endDate: Optional[str] = None
 
 
 def lambda_handler(event, context):
     try:
-        body = json.loads(event.get("body", "{}"))
-    except json.JSONDecodeError:
-        return {
-            "statusCode": 400,
-            "headers": {"Content-Type": "application/json"},
-            "body": json.dumps({"message": "Invalid JSON"}),
-        }
-    student_id = body.get("studentId")
-    start_date = body.get("startDate")
-    end_date = body.get("endDate")
-    logger.info("Generating report for %s from %s to %s", student_id, start_date, end_date)
+        req = decode(event.get("body") or "{}", GenerateReportRequest)
+    except SchemaError:
+        return err(400, "Invalid request body")
+    except ValueError:
+        return err(400, "Invalid JSON")
+    student_id = req.studentId
+    start_date = req.startDate
+    end_date = req.endDate
+    logger.debug("Generating report for %s from %s to %s", student_id, start_date, end_date)
     # TODO: Query DynamoDB and generate PDF
     # TODO: Upload PDF to S3 and send an email via SES
-    return {
-        "statusCode": 200,
-        "headers": {"Content-Type": "application/json"},
-        "body": json.dumps({"message": "Report generation initiated"}),
-    }
\ No newline at end of file
+    return ok({"message": "Report generation initiated"})
\ No newline at end of file
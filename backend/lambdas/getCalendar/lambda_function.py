@@ -4,9 +4,15 @@ Returns a portion of the Plano ISD school calendar.  The real function
 would read a JSON or CSV file from S3 and filter events for the
 requested date range.
 """
-import json
 from datetime import datetime
 
+try:
+    from ..shared._common import CACHE_PUBLIC, ok
+except ImportError:
+    # Deployed on Lambda the handler is a top-level module and the
+    # helpers come from the shared layer.
+    from _common import CACHE_PUBLIC, ok
+
 
 SAMPLE_CALENDAR = [
     {"date": "2025-08-18", "event": "First day of school", "isSchoolDay": True},
@@ -14,11 +20,10 @@ SAMPLE_CALENDAR = [
     {"date": "2025-12-20", "event": "Winter break begins", "isSchoolDay": False},
 ]
 
+# The calendar is static, so serialise the response once per container.
+_RESPONSE = ok({"calendar": SAMPLE_CALENDAR}, cache_control=CACHE_PUBLIC)
+
 
 def lambda_handler(event, context):
     # In a real implementation you might pass startDate/endDate as query parameters
-    return {
-        "statusCode": 200,
-        "headers": {"Content-Type": "application/json"},
-        "body": json.dumps({"calendar": SAMPLE_CALENDAR}),
-    }
\ No newline at end of file
+    return _RESPONSE
\ No newline at end of file
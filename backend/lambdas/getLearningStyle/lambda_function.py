@@ -4,22 +4,34 @@ Returns the current learning‑style profile for a student.  It would
 normally compute this from historical answer data and update the
 DynamoDB profile.  Here we return a dummy profile.
 """
-import json
+try:
+    from ..shared._common import CACHE_PRIVATE, ok
+except ImportError:
+    # Deployed on Lambda the handler is a top-level module and the
+    # helpers come from the shared layer.
+    from _common import CACHE_PRIVATE, ok
 
 
-def lambda_handler(event, context):
-    student_id = None
-    if event.get("queryStringParameters"):
-        student_id = event["queryStringParameters"].get("studentId")
-    student_id = student_id or "unknown"
+def _profile_response(student_id: str) -> dict:
+    """Build the response carrying the (dummy) profile for ``student_id``."""
     profile = {
         "studentId": student_id,
         "preferredModalities": ["visual", "hands-on"],
         "accuracy": 0.85,
         "averageTimeSeconds": 12,
     }
-    return {
-        "statusCode": 200,
-        "headers": {"Content-Type": "application/json"},
-        "body": json.dumps(profile),
-    }
\ No newline at end of file
+    return ok(profile, cache_control=CACHE_PRIVATE)
+
+
+# Requests without a studentId always get the same answer, so build it
+# once per container.
+_UNKNOWN_RESPONSE = _profile_response("unknown")
+
+
+def lambda_handler(event, context):
+    student_id = None
+    if event.get("queryStringParameters"):
+        student_id = event["queryStringParameters"].get("studentId")
+    if not student_id:
+        return _UNKNOWN_RESPONSE
+    return _profile_response(student_id)
\ No newline at end of file
@@ -5,7 +5,8 @@ application the function would read the studentId from the request context,
 look up the student’s grade in DynamoDB, check the Plano ISD calendar and
 retrieve the appropriate lesson content from another DynamoDB table or S3.
 
-For this skeleton implementation we simply return a hard‑coded lesson.
+For this skeleton implementation lessons come from the bundled
+``lessons.json`` file and are selected by grade and day of the year.
 
 Expected event (API Gateway v2 format):
 {
@@ -13,73 +14,110 @@ Expected event (API Gateway v2 format):
 }
 
 Returns:
-  200 response with JSON body containing lesson title and description.
+  200 response with JSON body containing the date, grade and one lesson
+  per subject, or 404 if there are no lessons for the grade.
 """
-import json
-from datetime import datetime
+import os
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
 
+try:
+    from ..shared._common import CACHE_PUBLIC, err, loads, ok
+except ImportError:
+    # Deployed on Lambda the handler is a top-level module and the
+    # helpers come from the shared layer.
+    from _common import CACHE_PUBLIC, err, loads, ok
 
-def lambda_handler(event, context):
-    """Return today’s lessons for the given grade.
 
-    Reads lesson definitions from a JSON file bundled with the code
-    (`backend/lessons/lessons.json`).  Lessons are organized by grade and
-    subject.  To vary the content each day, the function computes the
-    day‑of‑year and uses it as an index into the lesson list for each
-    subject.  If the grade or subject is not found, a message is
-    returned instead.
-    """
-    # Determine the student’s grade (default to Kindergarten)
-    grade = None
-    if event.get("queryStringParameters"):
-        grade = event["queryStringParameters"].get("grade")
-    grade = grade or "K"
+def _find_lesson_file() -> str:
+    """Locate ``lessons.json``.
 
-    # Load lessons from the JSON file at invocation time.  Try multiple
-    # locations so the function works when packaged on Lambda or run
-    # locally.  The first match wins.
-    import os
-    lesson_file = None
+    Try multiple locations so the function works when packaged on
+    Lambda or run locally.  The first match wins.
+    """
     candidate_paths = [
         # When packaged, the file may be copied into the same directory as
         # the handler (e.g. via CodeUri packaging).
         os.path.join(os.path.dirname(__file__), "lessons.json"),
+        # Deployed by SAM, the file comes from LessonsLayer under /opt.
+        os.path.join(os.sep, "opt", "lessons.json"),
         # Fallback to the shared lessons directory in the repository.
         os.path.join(os.path.dirname(__file__), "..", "..", "lessons", "lessons.json"),
     ]
     for path in candidate_paths:
         if os.path.isfile(path):
-            lesson_file = path
-            break
-    if not lesson_file:
-        raise FileNotFoundError("lessons.json not found in expected locations")
-    with open(lesson_file, "r", encoding="utf-8") as f:
-        all_lessons = json.load(f)
-
-    grade_lessons = all_lessons.get(grade)
-    if not grade_lessons:
-        return {
-            "statusCode": 404,
-            "headers": {"Content-Type": "application/json"},
-            "body": json.dumps({"message": f"No lessons found for grade {grade}"}),
-        }
+            return path
+    raise FileNotFoundError("lessons.json not found in expected locations")
 
-    # Compute a deterministic index based on the current date.  Use
-    # America/Chicago time zone in production.  Here we use UTC.
-    day_of_year = datetime.utcnow().timetuple().tm_yday
+
+# The lesson file is static and bundled with the deployment, so load it
+# once per container at import time.  Warm invocations reuse the parsed
+# dict; a missing or malformed file fails the cold start rather than
+# every request.
+_LESSON_FILE = _find_lesson_file()
+with open(_LESSON_FILE, "rb") as _f:
+    _ALL_LESSONS = loads(_f.read())
+
+
+@lru_cache(maxsize=64)
+def _lessons_for(grade: str, day_of_year: int) -> dict:
+    """Pick one lesson per subject for ``grade`` on the given day.
+
+    The selection only changes once a day, so results are memoised per
+    ``(grade, day_of_year)``; entries for previous days simply age out
+    of the cache.  The returned dict is shared between calls and must
+    not be mutated.
+    """
     response_lessons = {}
-    for subject, lessons_list in grade_lessons.items():
+    for subject, lessons_list in _ALL_LESSONS[grade].items():
         if not lessons_list:
             continue
         index = day_of_year % len(lessons_list)
         response_lessons[subject] = lessons_list[index]
+    return response_lessons
+
+
+# Today's UTC day-of-year and ISO date, recomputed only when the UTC day
+# (seconds since the epoch // 86400) changes.
+_DATE_CACHE = {"stamp": -1, "doy": 0, "iso": ""}
+
+
+def _today() -> tuple:
+    """Return ``(day_of_year, "YYYY-MM-DD")`` for the current UTC day."""
+    stamp = int(time.time() // 86400)
+    if stamp != _DATE_CACHE["stamp"]:
+        now = datetime.fromtimestamp(stamp * 86400, tz=timezone.utc)
+        _DATE_CACHE.update(stamp=stamp, doy=now.timetuple().tm_yday, iso=now.strftime("%Y-%m-%d"))
+    return _DATE_CACHE["doy"], _DATE_CACHE["iso"]
+
+
+def lambda_handler(event, context):
+    """Return today’s lessons for the given grade.
+
+    Lesson definitions come from a JSON file bundled with the code
+    (`backend/lessons/lessons.json`) and are loaded once at import
+    time.  Lessons are organized by grade and subject.  To vary the
+    content each day, the function computes the day‑of‑year and uses it
+    as an index into the lesson list for each subject.  If the grade or
+    subject is not found, a message is returned instead.
+    """
+    # Determine the student’s grade (default to Kindergarten)
+    grade = None
+    if event.get("queryStringParameters"):
+        grade = event["queryStringParameters"].get("grade")
+    grade = grade or "K"
+
+    if not _ALL_LESSONS.get(grade):
+        return err(404, f"No lessons found for grade {grade}")
+
+    # Compute a deterministic index based on the current date.  Use
+    # America/Chicago time zone in production.  Here we use UTC.
+    day_of_year, today = _today()
+    response_lessons = _lessons_for(grade, day_of_year)
 
-    return {
-        "statusCode": 200,
-        "headers": {"Content-Type": "application/json"},
-        "body": json.dumps({
-            "date": datetime.utcnow().strftime("%Y-%m-%d"),
-            "grade": grade,
-            "lessons": response_lessons,
-        }),
-    }
\ No newline at end of file
+    return ok({
+        "date": today,
+        "grade": grade,
+        "lessons": response_lessons,
+    }, cache_control=CACHE_PUBLIC)
\ No newline at end of file
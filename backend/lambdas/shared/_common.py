@@ -0,0 +1,131 @@
+"""Helpers shared by the Lambda handlers.
+
+Every handler speaks JSON over API Gateway, so they all parse request
+bodies and build ``{"statusCode", "headers", "body"}`` responses the
+same way.  Keeping that here means the response shape cannot drift
+between endpoints.
+
+JSON goes through orjson (and request schemas through msgspec) when
+they are installed; otherwise the standard library is used.
+"""
+import json
+import logging
+import os
+import typing
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def _log_level() -> int:
+    """Level named by ``LOG_LEVEL`` (any case), or WARNING if unknown."""
+    level = logging.getLevelName(os.environ.get("LOG_LEVEL", "WARNING").upper())
+    return level if isinstance(level, int) else logging.WARNING
+
+
+# The handlers log through the root logger.  Routine per-invocation
+# messages are DEBUG, so by default they never reach CloudWatch.
+logging.getLogger().setLevel(_log_level())
+
+# Shared by every response rather than rebuilt per request.  Handlers
+# and callers must treat it as read-only.  (A MappingProxyType would
+# enforce that, but the Lambda runtime cannot serialise one.)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def loads(data):
+    """Parse JSON from ``str`` or ``bytes``."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def dumps(obj) -> bytes:
+    """Serialise ``obj`` to UTF-8 encoded JSON."""
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode("utf-8")
+
+
+class SchemaError(ValueError):
+    """Well-formed JSON that does not match the request schema."""
+
+
+@lru_cache(maxsize=None)
+def _field_types(schema) -> dict:
+    """Map each field of ``schema`` to the classes its value may have."""
+    allowed = {}
+    for name, hint in typing.get_type_hints(schema).items():
+        if typing.get_origin(hint) is typing.Union:
+            allowed[name] = typing.get_args(hint)
+        else:
+            allowed[name] = (hint,)
+    return allowed
+
+
+def decode(data, schema):
+    """Decode a JSON request body (``str`` or ``bytes``) into ``schema``.
+
+    msgspec decodes straight into the dataclass, allocating only the
+    fields it declares.  Without msgspec we parse to a dict, pick out the
+    declared fields and check them against the field annotations, so
+    both paths accept and reject the same bodies.  Unknown fields are
+    ignored.
+
+    Raises:
+        SchemaError: The body is not a JSON object or a field has the
+            wrong type.
+        ValueError: The body is not valid JSON.
+    """
+    if msgspec:
+        try:
+            return msgspec.json.decode(data, type=schema)
+        except msgspec.ValidationError as e:
+            raise SchemaError(str(e)) from e
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    body = loads(data)
+    if not isinstance(body, dict):
+        raise SchemaError("Expected a JSON object")
+    values = {}
+    for name, types in _field_types(schema).items():
+        if name not in body:
+            continue
+        value = body[name]
+        # Compare exact types: JSON values are never subclasses, except
+        # that bool must not pass for int.  Like msgspec, let ints
+        # through where a float is declared.
+        if type(value) not in types and not (type(value) is int and float in types):
+            raise SchemaError(f"Invalid type for field {name!r}")
+        values[name] = value
+    return schema(**values)
+
+
+# Cache-Control values for successful GET responses, so browsers and the
+# CDN in front of API Gateway can answer repeat hits themselves.
+# Per-student data must not sit in shared caches.
+CACHE_PUBLIC = "public, max-age=60"
+CACHE_PRIVATE = "private, max-age=60"
+_CACHE_HEADERS = {
+    CACHE_PUBLIC: {**_JSON_HEADERS, "Cache-Control": CACHE_PUBLIC},
+    CACHE_PRIVATE: {**_JSON_HEADERS, "Cache-Control": CACHE_PRIVATE},
+}
+
+
+def ok(obj, status: int = 200, cache_control: typing.Optional[str] = None) -> dict:
+    """Build a JSON response (API Gateway requires a ``str`` body).
+
+    ``cache_control``, if given, must be ``CACHE_PUBLIC`` or
+    ``CACHE_PRIVATE`` and is sent as the ``Cache-Control`` header.
+    """
+    headers = _CACHE_HEADERS[cache_control] if cache_control else _JSON_HEADERS
+    return {"statusCode": status, "headers": headers, "body": dumps(obj).decode("utf-8")}
+
+
+def err(status: int, message: str) -> dict:
+    """Build a JSON error response carrying ``{"message": message}``."""
+    return ok({"message": message}, status)
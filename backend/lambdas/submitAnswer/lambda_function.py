@@ -15,27 +15,38 @@ Expected event body (JSON):
 
 Returns a confirmation message.
 """
-import json
 import logging
+from dataclasses import dataclass
+from typing import Optional
+
+try:
+    from ..shared._common import SchemaError, decode, err, ok
+except ImportError:
+    # Deployed on Lambda the handler is a top-level module and the
+    # helpers come from the shared layer.
+    from _common import SchemaError, decode, err, ok
 
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+
+
+@dataclass
+class SubmitAnswerRequest:
+    """Body of a POST /answer request."""
+
+    studentId: Optional[str] = None
+    questionId: Optional[str] = None
+    answer: Optional[str] = None
+    correct: Optional[bool] = None
 
 
 def lambda_handler(event, context):
     try:
-        body = json.loads(event.get("body", "{}"))
-    except json.JSONDecodeError:
-        return {
-            "statusCode": 400,
-            "headers": {"Content-Type": "application/json"},
-            "body": json.dumps({"message": "Invalid JSON"}),
-        }
-
-    logger.info("Received answer: %s", body)
+        req = decode(event.get("body") or "{}", SubmitAnswerRequest)
+    except SchemaError:
+        return err(400, "Invalid request body")
+    except ValueError:
+        return err(400, "Invalid JSON")
+
+    logger.debug("Received answer: %s", req)
     # TODO: Insert into DynamoDB table
-    return {
-        "statusCode": 200,
-        "headers": {"Content-Type": "application/json"},
-        "body": json.dumps({"message": "Answer recorded"}),
-    }
\ No newline at end of file
+    return ok({"message": "Answer recorded"})
\ No newline at end of file
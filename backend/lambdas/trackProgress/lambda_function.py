@@ -5,17 +5,19 @@ student's recent answers and update their learning‑style profile.  It
 would read from a DynamoDB table of answers, compute statistics and
 write back to a profile table.  Here we simply log that the function ran.
 """
-import json
 import logging
 
+try:
+    from ..shared._common import ok
+except ImportError:
+    # Deployed on Lambda the handler is a top-level module and the
+    # helpers come from the shared layer.
+    from _common import ok
+
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
 
 
 def lambda_handler(event, context):
-    logger.info("Running trackProgress job")
+    logger.debug("Running trackProgress job")
     # TODO: Fetch recent answers from DynamoDB and compute learning style
-    return {
-        "statusCode": 200,
-        "body": json.dumps({"message": "Progress tracked"}),
-    }
\ No newline at end of file
+    return ok({"message": "Progress tracked"})
\ No newline at end of file
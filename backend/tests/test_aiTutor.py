@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+from backend.lambdas.aiTutor import lambda_function
+
+
+@pytest.fixture
+def bedrock(monkeypatch):
+    """Route aiTutor to a fake Bedrock and start each test with an empty cache."""
+    monkeypatch.setattr(lambda_function, "_PROVIDER", "bedrock")
+    monkeypatch.setattr(lambda_function, "_CACHE", {})
+    now = [1000.0]
+    monkeypatch.setattr(lambda_function, "_now", lambda: now[0])
+    calls = []
+    replies = {"reply": "Well done!"}
+
+    def fake_invoke(prompt):
+        calls.append(prompt)
+        return replies["reply"]
+
+    monkeypatch.setattr(lambda_function, "invoke_bedrock", fake_invoke)
+    return {"calls": calls, "now": now, "replies": replies}
+
+
+def _ask(question="What is 3 + 2?"):
+    event = {"body": json.dumps({"grade": "K", "subject": "Math", "question": question})}
+    response = lambda_function.lambda_handler(event, None)
+    return json.loads(response["body"])["response"]
+
+
+def test_cache_hit_skips_provider(bedrock):
+    assert _ask() == "Well done!"
+    assert _ask() == "Well done!"
+    assert len(bedrock["calls"]) == 1
+
+
+def test_expired_entry_reinvokes_provider(bedrock):
+    _ask()
+    bedrock["now"][0] += lambda_function._CACHE_TTL_SECONDS + 1
+    _ask()
+    assert len(bedrock["calls"]) == 2
+
+
+def test_size_cap_evicts_oldest_entry(bedrock, monkeypatch):
+    monkeypatch.setattr(lambda_function, "_CACHE_MAX_ENTRIES", 2)
+    _ask("q1")
+    _ask("q2")
+    _ask("q3")
+    assert len(lambda_function._CACHE) == 2
+    _ask("q3")
+    _ask("q2")
+    assert len(bedrock["calls"]) == 3
+    _ask("q1")
+    assert len(bedrock["calls"]) == 4
+
+
+@pytest.mark.parametrize("reply", [lambda_function._UNAVAILABLE_REPLY, lambda_function._NO_ANSWER_REPLY])
+def test_canned_replies_are_not_cached(bedrock, reply):
+    bedrock["replies"]["reply"] = reply
+    _ask()
+    _ask()
+    assert len(bedrock["calls"]) == 2
+    assert lambda_function._CACHE == {}
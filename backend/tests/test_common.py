@@ -0,0 +1,63 @@
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+
+from backend.lambdas.shared import _common
+
+
+def test_log_level_is_case_insensitive(monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "debug")
+    assert _common._log_level() == logging.DEBUG
+
+
+def test_log_level_falls_back_to_warning(monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "chatty")
+    assert _common._log_level() == logging.WARNING
+    monkeypatch.delenv("LOG_LEVEL")
+    assert _common._log_level() == logging.WARNING
+
+
+@dataclass
+class _Request:
+    name: Optional[str] = None
+    flag: Optional[bool] = None
+    note: str = ""
+
+
+@pytest.fixture(params=["msgspec", "stdlib"])
+def decode_path(request, monkeypatch):
+    """Run a test against both the msgspec and the fallback decoder."""
+    if request.param == "msgspec":
+        pytest.importorskip("msgspec")
+    else:
+        monkeypatch.setattr(_common, "msgspec", None)
+    return request.param
+
+
+@pytest.mark.parametrize("body", ['{"name": "a", "flag": true, "extra": 1}', b'{"name": "a", "flag": true, "extra": 1}'])
+def test_decode_accepts_str_and_bytes(decode_path, body):
+    assert _common.decode(body, _Request) == _Request(name="a", flag=True)
+
+
+def test_decode_applies_defaults(decode_path):
+    assert _common.decode("{}", _Request) == _Request()
+
+
+def test_decode_malformed_json_is_value_error(decode_path):
+    with pytest.raises(ValueError) as excinfo:
+        _common.decode(b"{", _Request)
+    assert not isinstance(excinfo.value, _common.SchemaError)
+
+
+@pytest.mark.parametrize("body", ["[]", '"text"', "3"])
+def test_decode_non_object_is_schema_error(decode_path, body):
+    with pytest.raises(_common.SchemaError):
+        _common.decode(body, _Request)
+
+
+@pytest.mark.parametrize("body", ['{"name": 3}', '{"flag": "yes"}', '{"flag": 1}', '{"note": null}'])
+def test_decode_wrong_field_type_is_schema_error(decode_path, body):
+    with pytest.raises(_common.SchemaError):
+        _common.decode(body, _Request)
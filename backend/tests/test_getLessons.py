@@ -5,5 +5,15 @@ from backend.lambdas.getLessons import lambda_function
 def test_get_lessons_returns_default_grade():
     response = lambda_function.lambda_handler({}, None)
     assert response["statusCode"] == 200
+    assert response["headers"]["Cache-Control"] == "public, max-age=60"
     body = json.loads(response["body"])
-    assert body["title"].startswith("Sample K Lesson")
\ No newline at end of file
+    assert body["grade"] == "K"
+    assert set(body["lessons"]) == {"Math", "Reading", "Science"}
+    for lesson in body["lessons"].values():
+        assert lesson["id"].startswith("K-")
+
+
+def test_get_lessons_unknown_grade_returns_404():
+    response = lambda_function.lambda_handler({"queryStringParameters": {"grade": "12"}}, None)
+    assert response["statusCode"] == 404
+    assert "Cache-Control" not in response["headers"]